@@ -5,39 +5,38 @@ from contextlib import asynccontextmanager
 from typing import Optional
 
 import httpx
-from fastapi import Depends, FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Request
 
 from .google_client import GooglePlacesClient, parse_place_id
 from .models import AnalysisResponse, AnalyzeRequest
 from .scoring import analyze_place
 
 logger = logging.getLogger(__name__)
-_client: Optional[GooglePlacesClient] = None
 
 
 @asynccontextmanager
-async def lifespan(_: FastAPI):
-    global _client
+async def lifespan(app: FastAPI):
     try:
-        _client = GooglePlacesClient()
+        client = GooglePlacesClient()
     except ValueError as exc:
         logger.error("Google client initialization failed: %s", exc)
         raise
+    app.state.google_client = client
     try:
         yield
     finally:
-        if _client is not None:
-            await _client.close()
-            _client = None
+        app.state.google_client = None
+        await client.close()
 
 
 app = FastAPI(title="SagiCheck API", version="0.1.0", lifespan=lifespan)
 
 
-def get_google_client() -> GooglePlacesClient:
-    if _client is None:
+def get_google_client(request: Request) -> GooglePlacesClient:
+    client: Optional[GooglePlacesClient] = getattr(request.app.state, "google_client", None)
+    if client is None:
         raise HTTPException(status_code=500, detail="Google Places クライアントが初期化されていません。")
-    return _client
+    return client
 
 
 @app.post("/analyze", response_model=AnalysisResponse)
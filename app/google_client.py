@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import re
@@ -9,12 +10,16 @@ from typing import List, Optional
 from urllib.parse import parse_qs, unquote, urlparse
 
 import httpx
+import orjson
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
 
 from .models import PlaceData, PlaceReview
 
 GOOGLE_DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
 GOOGLE_V1_BASE = "https://places.googleapis.com/v1"
 PLACE_ID_PATTERN = re.compile(r"!1s([^!]+)!?")
+PLACE_ID_QUERY_PATTERN = re.compile(r"[?&](?:query_place_id|place_id|placeid)=([^&#]+)")
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +29,14 @@ def parse_place_id(url: Optional[str]) -> Optional[str]:
     if not url:
         return None
 
+    # Fast path for the common ?query_place_id=/place_id= URLs: one compiled
+    # regex scan instead of urlparse + parse_qs allocations per request.
+    match = PLACE_ID_QUERY_PATTERN.search(url)
+    if match:
+        candidate = unquote(match.group(1))
+        if candidate:
+            return unicodedata.normalize("NFKC", candidate)
+
     def _extract(parsed_url) -> Optional[str]:
         query = parse_qs(parsed_url.query)
         for key in ("query_place_id", "place_id", "placeid"):
@@ -63,14 +76,60 @@ class GooglePlacesClient:
         self.api_key = api_key or os.getenv("GOOGLE_MAPS_API_KEY")
         if not self.api_key:
             raise ValueError("GOOGLE_MAPS_API_KEY is not set")
-        self._client = httpx.AsyncClient(timeout=timeout)
+        # HTTP/2 multiplexes the details and reviews requests over one connection.
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            http2=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        # Cap concurrent requests against Google endpoints to stay within rate limits.
+        self._semaphore = asyncio.BoundedSemaphore(3)
+        # Token bucket pacing outgoing requests so we block briefly instead of
+        # racing into 429s and their much longer backoffs.
+        self._limiter = AsyncLimiter(5, 1)
+        # Place data rarely changes minute-to-minute; cache it briefly so
+        # repeated analyses of the same place skip the Google round trips.
+        self._place_cache: TTLCache[tuple[str, int], PlaceData] = TTLCache(maxsize=1024, ttl=300)
+        self._inflight: dict[tuple[str, int], asyncio.Task[PlaceData]] = {}
 
     async def close(self) -> None:
         await self._client.aclose()
 
     async def fetch_place(self, place_id: str, max_reviews: int = 100) -> PlaceData:
-        details = await self._fetch_details(place_id)
-        reviews = await self._fetch_reviews(place_id, max_reviews)
+        key = (place_id, max_reviews)
+        cached = self._place_cache.get(key)
+        if cached is not None:
+            return cached
+        # Single-flight: the shared fetch runs in its own task, decoupled from
+        # whichever request started it, so it completes and populates the cache
+        # even if that request disconnects. Every caller awaits it through a
+        # shield so cancelling one request never cancels the others.
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_and_cache(key, place_id, max_reviews))
+            self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _fetch_and_cache(self, key: tuple[str, int], place_id: str, max_reviews: int) -> PlaceData:
+        try:
+            place = await self._fetch_place_uncached(place_id, max_reviews)
+            self._place_cache[key] = place
+            return place
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _fetch_place_uncached(self, place_id: str, max_reviews: int) -> PlaceData:
+        details, reviews = await asyncio.gather(
+            self._fetch_details(place_id),
+            self._fetch_reviews(place_id, max_reviews),
+            return_exceptions=True,
+        )
+        # The two requests are independent; run them concurrently and re-raise
+        # the first failure so the API layer still sees httpx.HTTPStatusError.
+        if isinstance(details, BaseException):
+            raise details
+        if isinstance(reviews, BaseException):
+            raise reviews
         if not reviews and details.get("reviews"):
             reviews = [self._convert_details_review(r) for r in details["reviews"] if r]
         return PlaceData(
@@ -81,6 +140,37 @@ class GooglePlacesClient:
             reviews=[r for r in reviews if r is not None],
         )
 
+    async def _get_with_retry(self, url: str, **kwargs) -> httpx.Response:
+        """GET through the rate limiter, retrying 429/5xx with backoff.
+
+        Returns the final response without raising; callers keep their own
+        raise_for_status handling.
+        """
+
+        max_attempts = 3
+        delay = 1.0
+        for attempt in range(max_attempts):
+            async with self._limiter:
+                async with self._semaphore:
+                    resp = await self._client.get(url, **kwargs)
+            if resp.status_code != 429 and resp.status_code < 500:
+                break
+            if attempt == max_attempts - 1:
+                break
+            wait = delay
+            retry_after = resp.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    wait = float(retry_after)
+                except ValueError:
+                    pass
+            logger.warning(
+                "Google API returned %s for %s, retrying in %.1fs", resp.status_code, url, wait
+            )
+            await asyncio.sleep(wait)
+            delay *= 2
+        return resp
+
     async def _fetch_details(self, place_id: str) -> dict:
         params = {
             "place_id": place_id,
@@ -89,9 +179,11 @@ class GooglePlacesClient:
             "reviews_no_translations": "true",
             "reviews_sort": "newest",
         }
-        resp = await self._client.get(GOOGLE_DETAILS_URL, params=params)
+        resp = await self._get_with_retry(GOOGLE_DETAILS_URL, params=params)
         resp.raise_for_status()
-        data = resp.json()
+        # Review payloads are heavy in non-ASCII text; orjson decodes them
+        # several times faster than the stdlib json used by resp.json().
+        data = orjson.loads(resp.content)
         if data.get("status") != "OK":
             message = data.get("error_message", data.get("status", "UNKNOWN_ERROR"))
             raise RuntimeError(f"Google Places Details error: {message}")
@@ -114,42 +206,55 @@ class GooglePlacesClient:
         seen_tokens: set[str] = set()
         max_pages = 20
         page_count = 0
-        while len(collected) < max_reviews and page_count < max_pages:
-            page_count += 1
-            if next_page_token:
-                if next_page_token in seen_tokens:
-                    logger.warning("Detected circular Google reviews page token for %s", place_id)
-                    break
-                seen_tokens.add(next_page_token)
-                params["pageToken"] = next_page_token
-            else:
-                params.pop("pageToken", None)
-            try:
-                resp = await self._client.get(url, headers=headers, params=params)
-                resp.raise_for_status()
-            except httpx.HTTPStatusError as exc:
-                status = exc.response.status_code
-                if status == 404:
-                    break
-                if status == 429:
-                    logger.warning("Rate limited by Google Places reviews API for %s", place_id)
-                elif status == 403:
-                    logger.error("Google Places reviews API forbidden (check key/quota) for %s", place_id)
+        fetched = 0
+        # Pagination is serial on nextPageToken, but page conversion can run as
+        # a background task so JSON decode + validation overlap the next round trip.
+        conversion_tasks: List[asyncio.Task[List[PlaceReview]]] = []
+        try:
+            while fetched < max_reviews and page_count < max_pages:
+                page_count += 1
+                if next_page_token:
+                    if next_page_token in seen_tokens:
+                        logger.warning("Detected circular Google reviews page token for %s", place_id)
+                        break
+                    seen_tokens.add(next_page_token)
+                    params["pageToken"] = next_page_token
                 else:
-                    logger.error("Google Places reviews API error %s for %s", status, place_id)
-                raise
-            payload = resp.json()
-            reviews = payload.get("reviews", [])
-            for review in reviews:
-                converted = self._convert_v1_review(review)
-                if converted:
-                    collected.append(converted)
-                    if len(collected) >= max_reviews:
+                    params.pop("pageToken", None)
+                try:
+                    resp = await self._get_with_retry(url, headers=headers, params=params)
+                    resp.raise_for_status()
+                except httpx.HTTPStatusError as exc:
+                    status = exc.response.status_code
+                    if status == 404:
                         break
-            next_page_token = payload.get("nextPageToken")
-            if not next_page_token:
-                break
-        return collected
+                    if status == 429:
+                        logger.warning("Rate limited by Google Places reviews API for %s", place_id)
+                    elif status == 403:
+                        logger.error("Google Places reviews API forbidden (check key/quota) for %s", place_id)
+                    else:
+                        logger.error("Google Places reviews API error %s for %s", status, place_id)
+                    raise
+                payload = orjson.loads(resp.content)
+                reviews = payload.get("reviews", [])
+                # Count only entries the converter will keep (rating present),
+                # so pages with rating-less reviews do not end pagination early.
+                fetched += sum(1 for review in reviews if review.get("rating") is not None)
+                conversion_tasks.append(asyncio.create_task(self._convert_v1_page(reviews)))
+                next_page_token = payload.get("nextPageToken")
+                if not next_page_token:
+                    break
+        except BaseException:
+            for task in conversion_tasks:
+                task.cancel()
+            raise
+        for task in conversion_tasks:
+            collected.extend(await task)
+        return collected[:max_reviews]
+
+    async def _convert_v1_page(self, reviews: List[dict]) -> List[PlaceReview]:
+        converted = (self._convert_v1_review(review) for review in reviews)
+        return [review for review in converted if review is not None]
 
     def _convert_v1_review(self, review: dict) -> Optional[PlaceReview]:
         rating = review.get("rating")
@@ -167,7 +272,7 @@ class GooglePlacesClient:
                 created_at = datetime.fromisoformat(publish_time.replace("Z", "+00:00"))
             except ValueError:
                 pass
-        return PlaceReview(rating=float(rating), text=text, created_at=created_at)
+        return PlaceReview(rating=float(rating), text=text or "", created_at=created_at)
 
     def _convert_details_review(self, review: dict) -> Optional[PlaceReview]:
         rating = review.get("rating")
@@ -181,4 +286,4 @@ class GooglePlacesClient:
                 created_at = datetime.fromtimestamp(int(timestamp), tz=timezone.utc)
             except (ValueError, TypeError):
                 pass
-        return PlaceReview(rating=float(rating), text=text, created_at=created_at)
+        return PlaceReview(rating=float(rating), text=text or "", created_at=created_at)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, NamedTuple, Optional
 
 from pydantic import BaseModel, Field, HttpUrl
 
@@ -13,10 +13,17 @@ class AnalyzeRequest(BaseModel):
     tabelog_name: Optional[str] = None
 
 
-class PlaceReview(BaseModel):
-    rating: float = Field(ge=1, le=5)
-    text: str = ""
+class PlaceReview(NamedTuple):
+    """A single review row.
+
+    Kept as a NamedTuple rather than a model: up to 100 of these exist per
+    request and scoring only reads the three fields, so tuple storage avoids
+    the per-instance overhead of a full Pydantic object.
+    """
+
+    rating: float
     created_at: datetime
+    text: str = ""
 
 
 class PlaceData(BaseModel):
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-import difflib
+import functools
+import re
 import unicodedata
-from collections import Counter, deque
-from datetime import datetime, timedelta
-from typing import List, Optional, Sequence
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional
 
-from .models import AnalysisResponse, AnalysisSignals, AnalyzeRequest, FraudKeywordCount, PlaceData, PlaceReview
+import numba
+import numpy as np
+from rapidfuzz import fuzz
+
+from .models import AnalysisResponse, AnalysisSignals, AnalyzeRequest, FraudKeywordCount, PlaceData
 
 FRAUD_KEYWORDS = [
     "詐欺",
@@ -23,6 +28,25 @@ FRAUD_KEYWORDS = [
 ]
 BUSINESS_SUFFIXES = ["株式会社", "（株）", "(株)", "有限会社", "合同会社", "inc", "co.,ltd", "co., ltd", "llc"]
 
+_FRAUD_KEYWORDS_LOWER = [keyword.lower() for keyword in FRAUD_KEYWORDS]
+
+# One compiled alternation scans each review in a single C-level pass; the
+# named groups map matches back to their canonical keyword. Longest-first so
+# e.g. "rip off" is not shadowed by a shorter overlapping alternative.
+_FRAUD_KEYWORD_RE = re.compile(
+    "|".join(
+        f"(?P<kw{index}>{re.escape(lowered)})"
+        for index, lowered in sorted(
+            enumerate(_FRAUD_KEYWORDS_LOWER), key=lambda item: len(item[1]), reverse=True
+        )
+    )
+)
+
+# Longest-first alternation so e.g. "co., ltd" is not shadowed by a shorter suffix.
+_BUSINESS_SUFFIX_RE = re.compile(
+    "|".join(re.escape(suffix) for suffix in sorted(BUSINESS_SUFFIXES, key=len, reverse=True))
+)
+
 
 def clamp(x: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, x))
@@ -32,13 +56,44 @@ def analyze_place(place: PlaceData, request: AnalyzeRequest) -> AnalysisResponse
     reviews = place.reviews
     total_reviews = len(reviews)
 
-    short_5_ratio = _calc_short_5_ratio(reviews, total_reviews)
-    burst_7day_ratio = _calc_burst_ratio(reviews, total_reviews)
+    # Single fused pass over the reviews: every per-review quantity (rating,
+    # normalized text length, fraud hits, timestamp) is extracted here once.
+    # The string work stays in Python; the numeric reductions run in the
+    # compiled _score_arrays kernel below.
+    rating_values: List[float] = []
+    length_values: List[int] = []
+    fraud_flags: List[bool] = []
+    day_values: List[int] = []
+    keyword_counts: Counter[str] = Counter()
+    for review in reviews:
+        rating_values.append(review.rating)
+        normalized = _normalize_lower(review.text)
+        length_values.append(len(normalized))
+        matched = _match_fraud_keywords(normalized)
+        fraud_flags.append(bool(matched))
+        # Update in canonical keyword order so the fraud_keywords response
+        # order stays deterministic across runs (matched is a set).
+        keyword_counts.update(keyword for keyword in FRAUD_KEYWORDS if keyword in matched)
+        created_at = review.created_at
+        if isinstance(created_at, datetime):
+            day_values.append(int(created_at.timestamp() // 86400))
+    ratings = np.asarray(rating_values, dtype=np.int8)
+    text_lens = np.asarray(length_values, dtype=np.int32)
+    days = np.asarray(day_values, dtype=np.int64)
+    fraud_hits = np.asarray(fraud_flags, dtype=np.uint8)
+
+    short5_count, low_count, max_in_window, fraud_hit_reviews = _score_arrays(
+        ratings, text_lens, days, fraud_hits
+    )
+
+    short_5_ratio = short5_count / total_reviews if total_reviews else 0.0
+    burst_7day_ratio = max_in_window / total_reviews if total_reviews >= 5 else 0.0
     rating_diff = _calc_rating_diff(place.rating, request.tabelog_rating)
     tabelog_missing = request.tabelog_rating is None and request.tabelog_review_count is None
     name_similarity = _calc_name_similarity(place.name, request.tabelog_name)
-    low_star_ratio = _calc_low_star_ratio(reviews, total_reviews)
-    fraud_keyword_ratio, fraud_keyword_detail = _calc_fraud_stats(reviews, total_reviews)
+    low_star_ratio = low_count / total_reviews if total_reviews else 0.0
+    fraud_keyword_ratio = fraud_hit_reviews / total_reviews if total_reviews else 0.0
+    fraud_keyword_detail = keyword_counts
 
     signals = AnalysisSignals(
         total_reviews=total_reviews,
@@ -74,37 +129,59 @@ def analyze_place(place: PlaceData, request: AnalyzeRequest) -> AnalysisResponse
     )
 
 
+@functools.lru_cache(maxsize=4096)
 def _normalize_text(text: str) -> str:
     return unicodedata.normalize("NFKC", text or "").strip()
 
 
-def _calc_short_5_ratio(reviews: Sequence[PlaceReview], total: int) -> float:
-    if total == 0:
-        return 0.0
-    short_count = 0
-    for review in reviews:
-        if review.rating == 5:
-            normalized = _normalize_text(review.text)
-            if len(normalized) <= 15:
-                short_count += 1
-    return short_count / total
-
-
-def _calc_burst_ratio(reviews: Sequence[PlaceReview], total: int) -> float:
-    if total < 5:
-        return 0.0
-    times = sorted((review.created_at for review in reviews if isinstance(review.created_at, datetime)))
-    if not times:
-        return 0.0
-    window = deque()
+@functools.lru_cache(maxsize=4096)
+def _normalize_lower(text: str) -> str:
+    """Normalized and lowered review text, computed once per unique string."""
+    return unicodedata.normalize("NFKC", text or "").strip().lower()
+
+
+@numba.njit(cache=True)
+def _score_arrays(
+    ratings: np.ndarray, text_lens: np.ndarray, days: np.ndarray, fraud_hits: np.ndarray
+) -> tuple[int, int, int, int]:
+    """Numeric reductions for analyze_place in one compiled loop.
+
+    Returns (short-5 count, low-star count, max reviews in any 7-day window,
+    fraud-hit review count). The burst window slides a length-7 sum over a
+    day-bucket histogram: O(N + D) with D the day span of the reviews.
+    """
+
+    short5_count = 0
+    low_count = 0
+    fraud_count = 0
+    for i in range(ratings.shape[0]):
+        rating = ratings[i]
+        if rating == 5 and text_lens[i] <= 15:
+            short5_count += 1
+        if rating == 1 or rating == 2:
+            low_count += 1
+        if fraud_hits[i]:
+            fraud_count += 1
+
     max_in_window = 0
-    for ts in times:
-        window.append(ts)
-        cutoff = ts - timedelta(days=7)
-        while window and window[0] < cutoff:
-            window.popleft()
-        max_in_window = max(max_in_window, len(window))
-    return max_in_window / total if total else 0.0
+    if days.shape[0] > 0:
+        span = int(days.max() - days.min()) + 1
+        if span <= 7:
+            max_in_window = days.shape[0]
+        else:
+            counts = np.zeros(span, dtype=np.int64)
+            day_min = days.min()
+            for i in range(days.shape[0]):
+                counts[days[i] - day_min] += 1
+            window = 0
+            for i in range(7):
+                window += counts[i]
+            max_in_window = int(window)
+            for i in range(7, span):
+                window += counts[i] - counts[i - 7]
+                if window > max_in_window:
+                    max_in_window = int(window)
+    return short5_count, low_count, max_in_window, fraud_count
 
 
 def _calc_rating_diff(google_rating: Optional[float], tabelog_rating: Optional[float]) -> Optional[float]:
@@ -120,38 +197,20 @@ def _calc_name_similarity(google_name: str, tabelog_name: Optional[str]) -> Opti
     t_norm = _normalize_name(tabelog_name)
     if not g_norm or not t_norm:
         return None
-    return difflib.SequenceMatcher(a=g_norm, b=t_norm).ratio()
+    return fuzz.ratio(g_norm, t_norm) / 100.0
 
 
+@functools.lru_cache(maxsize=1024)
 def _normalize_name(name: str) -> str:
-    text = _normalize_text(name).lower()
-    for suffix in BUSINESS_SUFFIXES:
-        text = text.replace(suffix, "")
+    text = _BUSINESS_SUFFIX_RE.sub("", _normalize_text(name).lower())
     return text.replace(" ", "")
 
 
-def _calc_low_star_ratio(reviews: Sequence[PlaceReview], total: int) -> float:
-    if total == 0:
-        return 0.0
-    low = sum(1 for review in reviews if review.rating in (1, 2))
-    return low / total
-
-
-def _calc_fraud_stats(reviews: Sequence[PlaceReview], total: int) -> tuple[float, Counter[str]]:
-    if total == 0:
-        return 0.0, Counter()
-    keyword_counts: Counter[str] = Counter()
-    hit_reviews = 0
-    for review in reviews:
-        normalized = _normalize_text(review.text).lower()
-        matched_any = False
-        for keyword in FRAUD_KEYWORDS:
-            if keyword.lower() in normalized:
-                keyword_counts[keyword] += 1
-                matched_any = True
-        if matched_any:
-            hit_reviews += 1
-    return hit_reviews / total, keyword_counts
+def _match_fraud_keywords(lowered_text: str) -> set[str]:
+    return {
+        FRAUD_KEYWORDS[int(match.lastgroup[2:])]
+        for match in _FRAUD_KEYWORD_RE.finditer(lowered_text)
+    }
 
 
 def _calc_sakura_score(
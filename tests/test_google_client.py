@@ -1,6 +1,20 @@
+import asyncio
 from urllib.parse import quote
 
-from app.google_client import parse_place_id
+import httpx
+import pytest
+
+from app.google_client import GooglePlacesClient, parse_place_id
+from app.models import PlaceData
+
+
+def _make_client(monkeypatch) -> GooglePlacesClient:
+    monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
+    return GooglePlacesClient()
+
+
+def _make_place(place_id: str) -> PlaceData:
+    return PlaceData(place_id=place_id, name="サンプル", rating=4.0, user_ratings_total=1, reviews=[])
 
 
 def test_parse_place_id_with_standard_url():
@@ -22,3 +36,147 @@ def test_parse_place_id_without_id_returns_none():
 def test_parse_place_id_with_empty_or_none_returns_none():
     assert parse_place_id("") is None
     assert parse_place_id(None) is None
+
+
+async def test_fetch_place_serves_repeat_requests_from_cache(monkeypatch):
+    client = _make_client(monkeypatch)
+    calls = 0
+
+    async def fake_fetch(place_id, max_reviews):
+        nonlocal calls
+        calls += 1
+        return _make_place(place_id)
+
+    monkeypatch.setattr(client, "_fetch_place_uncached", fake_fetch)
+    first = await client.fetch_place("ChIJcache")
+    second = await client.fetch_place("ChIJcache")
+    assert first is second
+    assert calls == 1
+    await client.close()
+
+
+async def test_concurrent_fetches_share_one_upstream_call(monkeypatch):
+    client = _make_client(monkeypatch)
+    calls = 0
+    release = asyncio.Event()
+
+    async def fake_fetch(place_id, max_reviews):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return _make_place(place_id)
+
+    monkeypatch.setattr(client, "_fetch_place_uncached", fake_fetch)
+    tasks = [asyncio.create_task(client.fetch_place("ChIJburst")) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+    assert calls == 1
+    assert all(place.place_id == "ChIJburst" for place in results)
+    await client.close()
+
+
+async def test_failed_fetch_reaches_all_waiters_and_is_not_cached(monkeypatch):
+    client = _make_client(monkeypatch)
+    calls = 0
+    release = asyncio.Event()
+
+    async def failing_fetch(place_id, max_reviews):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        raise RuntimeError("upstream down")
+
+    monkeypatch.setattr(client, "_fetch_place_uncached", failing_fetch)
+    tasks = [asyncio.create_task(client.fetch_place("ChIJfail")) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert calls == 1
+
+    async def ok_fetch(place_id, max_reviews):
+        nonlocal calls
+        calls += 1
+        return _make_place(place_id)
+
+    monkeypatch.setattr(client, "_fetch_place_uncached", ok_fetch)
+    place = await client.fetch_place("ChIJfail")
+    assert place.place_id == "ChIJfail"
+    assert calls == 2
+    await client.close()
+
+
+async def test_cancelled_waiter_does_not_break_other_waiters(monkeypatch):
+    client = _make_client(monkeypatch)
+    release = asyncio.Event()
+
+    async def fake_fetch(place_id, max_reviews):
+        await release.wait()
+        return _make_place(place_id)
+
+    monkeypatch.setattr(client, "_fetch_place_uncached", fake_fetch)
+    leader = asyncio.create_task(client.fetch_place("ChIJcancel"))
+    await asyncio.sleep(0)
+    waiters = [asyncio.create_task(client.fetch_place("ChIJcancel")) for _ in range(2)]
+    await asyncio.sleep(0)
+    waiters[0].cancel()
+    release.set()
+    assert (await leader).place_id == "ChIJcancel"
+    assert (await waiters[1]).place_id == "ChIJcancel"
+    with pytest.raises(asyncio.CancelledError):
+        await waiters[0]
+    await client.close()
+
+
+async def test_cancelled_leader_does_not_break_waiters(monkeypatch):
+    client = _make_client(monkeypatch)
+    calls = 0
+    release = asyncio.Event()
+
+    async def fake_fetch(place_id, max_reviews):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return _make_place(place_id)
+
+    monkeypatch.setattr(client, "_fetch_place_uncached", fake_fetch)
+    leader = asyncio.create_task(client.fetch_place("ChIJleader"))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(client.fetch_place("ChIJleader"))
+    await asyncio.sleep(0)
+    leader.cancel()
+    release.set()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert (await waiter).place_id == "ChIJleader"
+    assert calls == 1
+    await client.close()
+
+
+async def test_get_with_retry_honors_retry_after(monkeypatch):
+    client = _make_client(monkeypatch)
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(503),
+        httpx.Response(200),
+    ]
+    attempts = 0
+
+    async def fake_get(url, **kwargs):
+        nonlocal attempts
+        attempts += 1
+        return responses[attempts - 1]
+
+    monkeypatch.setattr(client._client, "get", fake_get)
+    waits = []
+
+    async def fake_sleep(delay):
+        waits.append(delay)
+
+    monkeypatch.setattr("app.google_client.asyncio.sleep", fake_sleep)
+    resp = await client._get_with_retry("https://places.test/reviews")
+    assert resp.status_code == 200
+    assert attempts == 3
+    assert waits == [0.0, 2.0]
+    await client.close()